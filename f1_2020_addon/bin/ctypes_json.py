@@ -9,10 +9,25 @@ from json import JSONEncoder
 
 __version__ = '1.0.0'
 
+#
+# msivill added for exact-type fast path below
+#
+_SCALAR_TYPES = frozenset({bool, int, float, str, bytes})
+
 
 class CDataJSONEncoder(JSONEncoder):
     def default(self, obj):
 
+        #
+        # msivill added fast path - an exact type match is a single hash lookup and
+        # covers almost every value, avoiding the isinstance checks further down
+        #
+        obj_type = type(obj)
+        if obj_type in _SCALAR_TYPES:
+            if obj_type is bytes:
+                return obj.decode("utf-8")
+            return obj
+
         if isinstance(obj, (Array, list)):
             return [self.default(e) for e in obj]
 
@@ -118,71 +118,95 @@ class f1_2020_shared:
 
         first_collection_received = False
 
+        # reusable receive buffer, avoids allocating a new bytes object per datagram
+        receive_buffer = bytearray(2048)
+        receive_view = memoryview(receive_buffer)
+
         #
         # keep looping waiting for udp
         #
         while 1:
 
-            # get data and sending IP address from udp
-            udp_packet = udp_socket.recvfrom(2048)
+            # block until the next datagram arrives, reusing the same buffer
+            udp_socket.setblocking(True)
+            number_of_bytes, sender_address = udp_socket.recvfrom_into(receive_buffer)
 
             # show if data has been received for first time on this udp port
-            if first_collection_received == False:   
+            if first_collection_received == False:
                 first_collection_received = True
                 self.log_info("Modular input received first piece of data")
 
-            # get binary data from udp
-            try:
-                packet = unpack_udp_packet(udp_packet[0])
-            except Exception as e:
-                self.log_error("Error unpacking UDP packet - {}".format(e))
-                continue
-
-            # create source field based on sending IP address ( from udp data ) and port
-            try:
-                source = ":".join([ udp_packet[1][0], self.udp_port ])
-            except Exception as e:
-                self.log_error("Error generating source - {}".format(e))
-                continue
+            self.__process_udp_packet(receive_view[:number_of_bytes], sender_address)
 
             #
-            # check for late packets
+            # drain any datagrams already queued on the socket without blocking, so a
+            # burst of packets is processed as one batch before waiting again
             #
+            udp_socket.setblocking(False)
+            while 1:
+                try:
+                    number_of_bytes, sender_address = udp_socket.recvfrom_into(receive_buffer)
+                except BlockingIOError:
+                    break
+                self.__process_udp_packet(receive_view[:number_of_bytes], sender_address)
 
-            # key to lookup last time information
-            late_udp_packet_key = "".join([
-                 str(packet.header.packetId),
-                 str(packet.header.sessionUID),
-                 str(packet.header.packetVersion),
-                 source
-                 ])
 
-            #
-            # process/send data if UDP packet is not late arriving
-            #
-            if self.udp_packet_tracker.is_packet_late(late_udp_packet_key, packet.header.sessionTime) == False:
+        self.log_info("Modular input finished listening on port {}".format(self.udp_port))
 
-                # convert binary object into JSON
-                try:
-                    data = json.dumps(packet, cls=CDataJSONEncoder)
-                except Exception as e:
-                    self.log_error("Error converting packet to JSON - {}. Packet - {}".format(e,packet) )
-                    continue
+    #
+    # process one udp packet and send it to splunk unless it arrived late
+    #
+    def __process_udp_packet(self, udp_data, sender_address):
 
-                # get modular input local timezone friendly timestamp
-                formatted_local_timestamp = datetime.now().strftime("%s.%f")[:-3]
+        # get binary data from udp
+        try:
+            packet = unpack_udp_packet(udp_data)
+        except Exception as e:
+            self.log_error("Error unpacking UDP packet - {}".format(e))
+            return
 
-                # create sourcetype based on packedId and packetVersion         
-                try:
-                    sourcetype = self.__generate_sourcetype(packet.header.packetId,packet.header.packetVersion)
-                except Exception as e:
-                    self.log_error("Error generating sourcetype - {}".format(e))
-                    continue
+        # create source field based on sending IP address ( from udp data ) and port
+        try:
+            source = ":".join([ sender_address[0], self.udp_port ])
+        except Exception as e:
+            self.log_error("Error generating source - {}".format(e))
+            return
+
+        #
+        # check for late packets
+        #
 
-                self.output_event(data, formatted_local_timestamp, self.hostname, source, sourcetype)
+        # key to lookup last time information
+        late_udp_packet_key = "".join([
+             str(packet.header.packetId),
+             str(packet.header.sessionUID),
+             str(packet.header.packetVersion),
+             source
+             ])
 
+        #
+        # process/send data if UDP packet is not late arriving
+        #
+        if self.udp_packet_tracker.is_packet_late(late_udp_packet_key, packet.header.sessionTime) == False:
 
-        self.log_info("Modular input finished listening on port {}".format(self.udp_port))
+            # convert binary object into JSON
+            try:
+                data = json.dumps(packet, cls=CDataJSONEncoder)
+            except Exception as e:
+                self.log_error("Error converting packet to JSON - {}. Packet - {}".format(e,packet) )
+                return
+
+            # get modular input local timezone friendly timestamp
+            formatted_local_timestamp = datetime.now().strftime("%s.%f")[:-3]
+
+            # create sourcetype based on packedId and packetVersion
+            try:
+                sourcetype = self.__generate_sourcetype(packet.header.packetId,packet.header.packetVersion)
+            except Exception as e:
+                self.log_error("Error generating sourcetype - {}".format(e))
+                return
+
+            self.output_event(data, formatted_local_timestamp, self.hostname, source, sourcetype)
 
     #
     # work out source type using packetId and packetVersion
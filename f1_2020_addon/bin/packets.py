@@ -14,8 +14,12 @@ Compared to the definitions given there, the Python version has the following ch
 (4) In the 'CarStatusData' structure, tyreVisualCompound was renamed to visualTyreCompound.
 """
 
+import collections
 import ctypes
 import enum
+import struct
+import sys
+import types
 
 #########################################################
 #                                                       #
@@ -27,22 +31,48 @@ class PackedLittleEndianStructure(ctypes.LittleEndianStructure):
     """The standard ctypes LittleEndianStructure, but tightly packed (no field padding), and with a proper repr() function.
 
     This is the base type for all structures in the telemetry data.
+
+    Because the structures are packed and all fields are little-endian primitives, instances
+    can be constructed zero-copy with the standard ctypes from_buffer() classmethod over a
+    writable buffer (e.g. a reusable bytearray filled by socket.recv_into), avoiding the
+    memcpy that from_buffer_copy() performs per packet. Note that such instances view the
+    buffer directly, so they must be consumed before the buffer is overwritten.
     """
     _pack_ = 1
 
-    def __repr__(self):
-        fstr_list = []
-        for (fname, ftype) in self._fields_:
-            value = getattr(self, fname)
-            if isinstance(value, (PackedLittleEndianStructure, int, float, bytes)):
-                vstr = repr(value)
-            elif isinstance(value, ctypes.Array):
-                vstr = "[{}]".format(", ".join(repr(e) for e in value))
+    @classmethod
+    def _build_repr_plan(cls):
+        """Classify each field once so that repr() calls skip the per-field type dispatch.
+
+        The plan is a list of (fname, kind) pairs where kind 0 means repr() the value
+        directly (scalars, bytes and nested structures) and kind 1 means format it as a
+        ctypes array. The classification is derived from the declared field types alone,
+        so plans can be built at import time without an instance.
+        """
+        plan = []
+        for (fname, ftype) in cls._fields_:
+            if issubclass(ftype, ctypes.Array) and ftype._type_ is not ctypes.c_char:
+                kind = 1
             else:
-                raise RuntimeError("Bad value {!r} of type {!r}".format(value, type(value)))
-            fstr = f"{fname}={vstr}"
-            fstr_list.append(fstr)
-        return "{}({})".format(self.__class__.__name__, ", ".join(fstr_list))
+                kind = 0
+            plan.append((fname, kind))
+        cls._repr_plan = plan
+        return plan
+
+    @staticmethod
+    def _fmt_value(value, kind):
+        """Format a single field value according to its pre-classified repr kind."""
+        if kind == 0:
+            return repr(value)
+        return "[{}]".format(", ".join(map(repr, value)))
+
+    def __repr__(self):
+        plan = type(self).__dict__.get('_repr_plan')
+        if plan is None:
+            plan = self._build_repr_plan()
+        fmt = self._fmt_value
+        parts = [f"{fname}={fmt(getattr(self, fname), kind)}" for (fname, kind) in plan]
+        return f"{type(self).__name__}({', '.join(parts)})"
 
 
 ###########################################
@@ -67,6 +97,45 @@ class PacketHeader(PackedLittleEndianStructure):
     ]
 
 
+# Pre-compiled struct matching the PacketHeader field layout, for reading header fields
+# straight out of a raw datagram without constructing a ctypes PacketHeader instance.
+_HEADER_STRUCT = struct.Struct('<HBBBBQfIBB')
+
+# Named tuple view of the packet header. Field access is a C-level tuple index, so
+# dispatch code can read e.g. packetId without any ctypes descriptor involvement.
+Header = collections.namedtuple('Header', ['packetFormat', 'gameMajorVersion', 'gameMinorVersion',
+                                           'packetVersion', 'packetId', 'sessionUID', 'sessionTime',
+                                           'frameIdentifier', 'playerCarIndex', 'secondaryPlayerCarIndex'])
+
+
+def peek_packet_id(buf):
+    """Read the packetId field directly from a raw packet buffer.
+
+    The packetId is a single byte at a fixed offset in the header, so dispatching on it
+    does not require unpacking (or instantiating) the full header.
+
+    Args:
+        buf: the raw bytes of the UDP packet (at least the 24-byte header).
+
+    Returns:
+        The packetId header field as an int.
+    """
+    return buf[5]
+
+
+def parse_header(buf, offset=0):
+    """Unpack the 24-byte packet header from a raw packet buffer.
+
+    Args:
+        buf: the raw bytes of the UDP packet (at least the 24-byte header).
+        offset: position of the start of the packet within buf.
+
+    Returns:
+        A Header named tuple with the header field values.
+    """
+    return Header._make(_HEADER_STRUCT.unpack_from(buf, offset))
+
+
 @enum.unique
 class PacketID(enum.IntEnum):
     """Value as specified in the PacketHeader.packetId header field, used to distinguish packet types."""
@@ -83,31 +152,34 @@ class PacketID(enum.IntEnum):
     LOBBY_INFO           = 9
 
 
-PacketID.short_description = {
-    PacketID.MOTION               : 'Motion',
-    PacketID.SESSION              : 'Session',
-    PacketID.LAP_DATA             : 'Lap Data',
-    PacketID.EVENT                : 'Event',
-    PacketID.PARTICIPANTS         : 'Participants',
-    PacketID.CAR_SETUPS           : 'Car Setups',
-    PacketID.CAR_TELEMETRY        : 'Car Telemetry',
-    PacketID.CAR_STATUS           : 'Car Status',
-    PacketID.FINAL_CLASSIFICATION : 'Final Classification',
-    PacketID.LOBBY_INFO           : 'Lobby information'
+# Descriptions are keyed by the integer packetId value, so looking one up from an
+# incoming packet is a direct dict lookup on the raw header byte with no PacketID
+# enum coercion (which would also trigger the enum descriptor protocol).
+PACKET_SHORT_DESC = {
+    0 : 'Motion',
+    1 : 'Session',
+    2 : 'Lap Data',
+    3 : 'Event',
+    4 : 'Participants',
+    5 : 'Car Setups',
+    6 : 'Car Telemetry',
+    7 : 'Car Status',
+    8 : 'Final Classification',
+    9 : 'Lobby information'
 }
 
 
-PacketID.long_description = {
-    PacketID.MOTION               : 'Contains all motion data for player\'s car – only sent while player is in control',
-    PacketID.SESSION              : 'Data about the session – track, time left',
-    PacketID.LAP_DATA             : 'Data about all the lap times of cars in the session',
-    PacketID.EVENT                : 'Various notable events that happen during a session',
-    PacketID.PARTICIPANTS         : 'List of participants in the session, mostly relevant for multiplayer',
-    PacketID.CAR_SETUPS           : 'Packet detailing car setups for cars in the race',
-    PacketID.CAR_TELEMETRY        : 'Telemetry data for all cars',
-    PacketID.CAR_STATUS           : 'Status data for all cars such as damage',
-    PacketID.FINAL_CLASSIFICATION : 'Final classification confirmation at the end of a race',
-    PacketID.LOBBY_INFO           : 'Information about players in a multiplayer lobby'
+PACKET_LONG_DESC = {
+    0 : 'Contains all motion data for player\'s car – only sent while player is in control',
+    1 : 'Data about the session – track, time left',
+    2 : 'Data about all the lap times of cars in the session',
+    3 : 'Various notable events that happen during a session',
+    4 : 'List of participants in the session, mostly relevant for multiplayer',
+    5 : 'Packet detailing car setups for cars in the race',
+    6 : 'Telemetry data for all cars',
+    7 : 'Status data for all cars such as damage',
+    8 : 'Final classification confirmation at the end of a race',
+    9 : 'Information about players in a multiplayer lobby'
 }
 
 #########################################################
@@ -173,6 +245,76 @@ class PacketMotionData_V1(PackedLittleEndianStructure):
         ('frontWheelsAngle'       , ctypes.c_float       )   # Current front wheels angle in radians
     ]
 
+    def wheel_array(self, name):
+        """Return one of the float[4] wheel arrays as a zero-copy memoryview of floats.
+
+        Indexing or slicing the returned view is a plain buffer access instead of a
+        ctypes array descriptor dispatch, and it can be fed straight into sum() or
+        similar reducers. The wheel order is RL, RR, FL, FR.
+
+        Args:
+            name: one of 'suspensionPosition', 'suspensionVelocity',
+                'suspensionAcceleration', 'wheelSpeed' or 'wheelSlip'.
+        """
+        index = _WHEEL_FLOAT_INDEX[name]
+        return memoryview(self).cast('f')[index:index + 4]
+
+
+# Float-element offsets of the float[4] wheel arrays within PacketMotionData_V1,
+# computed once from the ctypes field descriptors.
+_WHEEL_FLOAT_INDEX = {name: getattr(PacketMotionData_V1, name).offset // 4
+                      for name in ('suspensionPosition', 'suspensionVelocity',
+                                   'suspensionAcceleration', 'wheelSpeed', 'wheelSlip')}
+
+# Pre-compiled struct matching the CarMotionData_V1 field layout, for bulk decoding of
+# the 22-car motion array without per-field ctypes attribute access.
+_CAR_MOTION_STRUCT = struct.Struct('<6f6h6f')
+
+
+def unpack_car_motion(buf, offset=0):
+    """Bulk-decode the 22-element carMotionData array from a raw motion packet.
+
+    This avoids instantiating the full ctypes PacketMotionData_V1 structure when a
+    consumer only needs the per-car motion values, e.g. when aggregating across cars.
+
+    Args:
+        buf: raw bytes containing a motion packet (header included).
+        offset: position of the start of the motion packet within buf.
+
+    Returns:
+        A list of 22 tuples, one per car, holding the CarMotionData_V1 field values
+        in declaration order.
+    """
+    start = offset + _HEADER_STRUCT.size
+    region = memoryview(buf)[start:start + 22 * _CAR_MOTION_STRUCT.size]
+    return list(_CAR_MOTION_STRUCT.iter_unpack(region))
+
+
+def parse_motion_batch(buf):
+    """Bulk-decode a buffer of back-to-back motion packets, e.g. from a recorded session.
+
+    Replay and log ingest re-parse thousands of packets at a time, where constructing a
+    ctypes structure per packet dominates. This decodes the whole buffer in one pass
+    using only the pre-compiled structs.
+
+    Args:
+        buf: raw bytes holding a whole number of concatenated motion packets.
+
+    Returns:
+        A list with one (header, car_motion) pair per packet, where header is a Header
+        named tuple and car_motion the list of 22 per-car tuples.
+
+    Raises:
+        UnpackError if the buffer is not a whole number of motion packets.
+    """
+    packet_size = PACKET_SIZE[PacketID.MOTION]
+
+    if len(buf) % packet_size != 0:
+        raise UnpackError(f"Bad motion packet batch: {len(buf)} bytes is not a multiple of {packet_size} bytes.")
+
+    return [(parse_header(buf, base), unpack_car_motion(buf, base))
+            for base in range(0, len(buf), packet_size)]
+
 ##########################################################
 #                                                        #
 #  __________  Packet ID 1 : SESSION PACKET  __________  #
@@ -239,6 +381,22 @@ class PacketSessionData_V1(PackedLittleEndianStructure):
         ('weatherForecastSamples'   , WeatherForecastSample * 20)  # Array of weather forecast samples
     ]
 
+    def active_marshal_zones(self):
+        """Return only the marshal zones that are actually populated.
+
+        The marshalZones array always holds 21 elements but only the first
+        numMarshalZones carry data, so iterating the full array does dead work.
+        """
+        return self.marshalZones[:self.numMarshalZones]
+
+    def active_weather_samples(self):
+        """Return only the weather forecast samples that are actually populated.
+
+        The weatherForecastSamples array always holds 20 elements but only the first
+        numWeatherForecastSamples carry data, which is typically far fewer.
+        """
+        return self.weatherForecastSamples[:self.numWeatherForecastSamples]
+
 ###########################################################
 #                                                         #
 #  __________  Packet ID 2 : LAP DATA PACKET  __________  #
@@ -358,6 +516,43 @@ class EventDataDetails(ctypes.Union):
     ]
 
 
+# Event codes that carry no payload, keyed by the raw 4-byte event string code.
+_EVENT_NO_DETAILS = frozenset({b'CHQF', b'DRSD', b'DRSE', b'SEND', b'SSTA'})
+
+# Payload layout per event code, for decoding the event details straight from the raw
+# packet bytes rather than through the EventDataDetails union descriptors. The payload
+# sits immediately after the header and the 4-byte event string code.
+_EVENT_PAYLOAD_OFFSET = ctypes.sizeof(PacketHeader) + 4
+
+_EVENT_PAYLOAD_STRUCT = {
+    b'FTLP' : struct.Struct('<Bf'),
+    b'PENA' : struct.Struct('<BBBBBBB'),
+    b'RCWN' : struct.Struct('<B'),
+    b'RTMT' : struct.Struct('<B'),
+    b'SPTP' : struct.Struct('<Bf'),
+    b'TMPT' : struct.Struct('<B')
+}
+
+# Named tuple views of the event payloads. Field access on these is a plain C-level
+# tuple index, unlike the ctypes descriptor dispatch the union variants go through.
+FastestLap = collections.namedtuple('FastestLap', ['vehicleIdx', 'lapTime'])
+Penalty = collections.namedtuple('Penalty', ['penaltyType', 'infringementType', 'vehicleIdx',
+                                             'otherVehicleIdx', 'time', 'lapNum', 'placesGained'])
+RaceWinner = collections.namedtuple('RaceWinner', ['vehicleIdx'])
+Retirement = collections.namedtuple('Retirement', ['vehicleIdx'])
+SpeedTrap = collections.namedtuple('SpeedTrap', ['vehicleIdx', 'speed'])
+TeamMateInPits = collections.namedtuple('TeamMateInPits', ['vehicleIdx'])
+
+_EVENT_DISPATCH = {
+    b'FTLP' : (FastestLap    , _EVENT_PAYLOAD_STRUCT[b'FTLP']),
+    b'PENA' : (Penalty       , _EVENT_PAYLOAD_STRUCT[b'PENA']),
+    b'RCWN' : (RaceWinner    , _EVENT_PAYLOAD_STRUCT[b'RCWN']),
+    b'RTMT' : (Retirement    , _EVENT_PAYLOAD_STRUCT[b'RTMT']),
+    b'SPTP' : (SpeedTrap     , _EVENT_PAYLOAD_STRUCT[b'SPTP']),
+    b'TMPT' : (TeamMateInPits, _EVENT_PAYLOAD_STRUCT[b'TMPT'])
+}
+
+
 class PacketEventData_V1(PackedLittleEndianStructure):
     """This packet gives details of events that happen during the course of a session.
 
@@ -371,30 +566,35 @@ class PacketEventData_V1(PackedLittleEndianStructure):
         ('eventDetails'   , EventDataDetails )   # Event details - should be interpreted differently for each type
     ]
 
+    def unpack_event_details(self):
+        """Decode the event payload for this packet's event code from the raw bytes.
+
+        This bypasses the EventDataDetails union, whose every field read goes through the
+        ctypes descriptor machinery, by unpacking the payload region in one struct call.
+
+        Returns:
+            A named tuple matching the event code's payload (FastestLap, Penalty,
+            RaceWinner, Retirement, SpeedTrap or TeamMateInPits), or None for event
+            codes that carry no payload.
+        """
+        code = self.eventStringCode
+        dispatch = _EVENT_DISPATCH.get(code)
+        if dispatch is None:
+            if code in _EVENT_NO_DETAILS:
+                return None
+            raise RuntimeError("Bad event code {}".format(code))
+        tuple_type, payload_struct = dispatch
+        return tuple_type._make(payload_struct.unpack_from(bytes(self), _EVENT_PAYLOAD_OFFSET))
+
     def __repr__(self):
         msg = f"{self.__class__.__name__}(header={self.header!r}, eventStringCode={self.eventStringCode!r}"
 
-        event = self.eventStringCode.decode()
+        details = self.unpack_event_details()
 
-        if event in ["CHQF", "DRSD", "DRSE", "SEND", "SSTA"]:
+        if details is None:
             end = ")"
         else:
-            if event == "FTLP":
-                event_str = repr(self.eventDetails.fastestLap)
-            elif event == "PENA":
-                event_str = repr(self.eventDetails.penalty)
-            elif event == "RCWN":
-                event_str = repr(self.eventDetails.raceWinner)
-            elif event == "RTMT":
-                event_str = repr(self.eventDetails.retirement)
-            elif event == "SPTP":
-                event_str = repr(self.eventDetails.speedTrap)
-            elif event == "TMPT":
-                event_str = repr(self.eventDetails.teamMateInPits)
-            else:
-                raise RuntimeError("Bad event code {}", event)
-
-            end = f", eventDetails={event_str})"
+            end = f", eventDetails={details!r})"
 
         return f"{msg}{end}"
 
@@ -415,33 +615,35 @@ class EventStringCode(enum.Enum):
     SPTP = b'SPTP'
 
 
-EventStringCode.short_description = {
-    EventStringCode.SSTA : 'Session Started',
-    EventStringCode.SEND : 'Session Ended',
-    EventStringCode.FTLP : 'Fastest Lap',
-    EventStringCode.RTMT : 'Retirement',
-    EventStringCode.DRSE : 'DRS enabled',
-    EventStringCode.DRSD : 'DRS disabled',
-    EventStringCode.TMPT : 'Team mate in pits',
-    EventStringCode.CHQF : 'Chequered flag',
-    EventStringCode.RCWN : 'Race Winner',
-    EventStringCode.PENA : 'Penalty issued',
-    EventStringCode.SPTP : 'Speed trap triggered'
+# Descriptions are keyed by the raw 4-byte event string code, so looking one up from an
+# incoming packet is a single dict lookup with no EventStringCode enum coercion.
+EVENT_SHORT_DESC = {
+    b'SSTA' : 'Session Started',
+    b'SEND' : 'Session Ended',
+    b'FTLP' : 'Fastest Lap',
+    b'RTMT' : 'Retirement',
+    b'DRSE' : 'DRS enabled',
+    b'DRSD' : 'DRS disabled',
+    b'TMPT' : 'Team mate in pits',
+    b'CHQF' : 'Chequered flag',
+    b'RCWN' : 'Race Winner',
+    b'PENA' : 'Penalty issued',
+    b'SPTP' : 'Speed trap triggered'
 }
 
 
-EventStringCode.long_description = {
-    EventStringCode.SSTA : 'Sent when the session starts',
-    EventStringCode.SEND : 'Sent when the session ends',
-    EventStringCode.FTLP : 'When a driver achieves the fastest lap',
-    EventStringCode.RTMT : 'When a driver retires',
-    EventStringCode.DRSE : 'Race control have enabled DRS',
-    EventStringCode.DRSD : 'Race control have disabled DRS',
-    EventStringCode.TMPT : 'Your team mate has entered the pits',
-    EventStringCode.CHQF : 'The chequered flag has been waved',
-    EventStringCode.RCWN : 'The race winner is announced',
-    EventStringCode.PENA : 'A penalty has been issued',
-    EventStringCode.SPTP : 'Speed trap has been triggered'
+EVENT_LONG_DESC = {
+    b'SSTA' : 'Sent when the session starts',
+    b'SEND' : 'Sent when the session ends',
+    b'FTLP' : 'When a driver achieves the fastest lap',
+    b'RTMT' : 'When a driver retires',
+    b'DRSE' : 'Race control have enabled DRS',
+    b'DRSD' : 'Race control have disabled DRS',
+    b'TMPT' : 'Your team mate has entered the pits',
+    b'CHQF' : 'The chequered flag has been waved',
+    b'RCWN' : 'The race winner is announced',
+    b'PENA' : 'A penalty has been issued',
+    b'SPTP' : 'Speed trap has been triggered'
 }
 
 ###############################################################
@@ -464,6 +666,32 @@ class ParticipantData_V1(PackedLittleEndianStructure):
     ]
 
 
+class Participant:
+    """Lightweight wrapper around a ParticipantData_V1 entry that caches the decoded name.
+
+    ctypes returns a fresh bytes object on every read of the 48-byte name field, and the
+    value is then typically UTF-8 decoded again by the consumer. ctypes structures cannot
+    carry extra instance attributes, so this wrapper memoizes the decoded str once and
+    passes every other attribute through to the underlying entry.
+    """
+    __slots__ = ('raw', '_name')
+
+    def __init__(self, raw):
+        self.raw = raw
+        self._name = None
+
+    @property
+    def name(self):
+        name = self._name
+        if name is None:
+            name = self.raw.name.decode('utf-8')
+            self._name = name
+        return name
+
+    def __getattr__(self, attr):
+        return getattr(self.raw, attr)
+
+
 class PacketParticipantsData_V1(PackedLittleEndianStructure):
     """This is a list of participants in the race.
 
@@ -760,7 +988,11 @@ class PacketLobbyInfoData_V1(PackedLittleEndianStructure):
 #                                                                 #
 ###################################################################
 
-TeamIDs = {
+# Enumerations whose ID space is dense are stored as tuples, so a lookup is a direct
+# index with no hashing; gaps hold None. The sparse ID spaces (TeamIDs, DriverIDs) stay
+# as mappings, frozen against accidental mutation.
+
+TeamIDs = types.MappingProxyType({
      0 : 'Mercedes',
      1 : 'Ferrari',
      2 : 'Red Bull Racing',
@@ -820,10 +1052,10 @@ TeamIDs = {
     64 : 'McLaren 2010',
     65 : 'Ferrari 2010',
    255 : 'My Team'
-}
+})
 
 
-DriverIDs = {
+DriverIDs = types.MappingProxyType({
      0 : 'Carlos Sainz',
      1 : 'Daniil Kvyat',
      2 : 'Daniel Ricciardo',
@@ -902,223 +1134,242 @@ DriverIDs = {
     87 : 'Anthoine Hubert',
     88 : 'Giuliano Alesi',
     89 : 'Ralph Boschung'
-}
-
-
-TrackIDs = {
-     0 : 'Melbourne',
-     1 : 'Paul Ricard',
-     2 : 'Shanghai',
-     3 : 'Sakhir (Bahrain)',
-     4 : 'Catalunya',
-     5 : 'Monaco',
-     6 : 'Montreal',
-     7 : 'Silverstone',
-     8 : 'Hockenheim',
-     9 : 'Hungaroring',
-    10 : 'Spa',
-    11 : 'Monza',
-    12 : 'Singapore',
-    13 : 'Suzuka',
-    14 : 'Abu Dhabi',
-    15 : 'Texas',
-    16 : 'Brazil',
-    17 : 'Austria',
-    18 : 'Sochi',
-    19 : 'Mexico',
-    20 : 'Baku (Azerbaijan)',
-    21 : 'Sakhir Short',
-    22 : 'Silverstone Short',
-    23 : 'Texas Short',
-    24 : 'Suzuka Short',
-    25 : 'Hanoi',
-    26 : 'Zandvoort'
-}
-
-
-NationalityIDs = {
-     1 : 'American',
-     2 : 'Argentinian',
-     3 : 'Australian',
-     4 : 'Austrian',
-     5 : 'Azerbaijani',
-     6 : 'Bahraini',
-     7 : 'Belgian',
-     8 : 'Bolivian',
-     9 : 'Brazilian',
-    10 : 'British',
-    11 : 'Bulgarian',
-    12 : 'Cameroonian',
-    13 : 'Canadian',
-    14 : 'Chilean',
-    15 : 'Chinese',
-    16 : 'Colombian',
-    17 : 'Costa Rican',
-    18 : 'Croatian',
-    19 : 'Cypriot',
-    20 : 'Czech',
-    21 : 'Danish',
-    22 : 'Dutch',
-    23 : 'Ecuadorian',
-    24 : 'English',
-    25 : 'Emirian',
-    26 : 'Estonian',
-    27 : 'Finnish',
-    28 : 'French',
-    29 : 'German',
-    30 : 'Ghanaian',
-    31 : 'Greek',
-    32 : 'Guatemalan',
-    33 : 'Honduran',
-    34 : 'Hong Konger',
-    35 : 'Hungarian',
-    36 : 'Icelander',
-    37 : 'Indian',
-    38 : 'Indonesian',
-    39 : 'Irish',
-    40 : 'Israeli',
-    41 : 'Italian',
-    42 : 'Jamaican',
-    43 : 'Japanese',
-    44 : 'Jordanian',
-    45 : 'Kuwaiti',
-    46 : 'Latvian',
-    47 : 'Lebanese',
-    48 : 'Lithuanian',
-    49 : 'Luxembourger',
-    50 : 'Malaysian',
-    51 : 'Maltese',
-    52 : 'Mexican',
-    53 : 'Monegasque',
-    54 : 'New Zealander',
-    55 : 'Nicaraguan',
-    56 : 'North Korean',
-    57 : 'Northern Irish',
-    58 : 'Norwegian',
-    59 : 'Omani',
-    60 : 'Pakistani',
-    61 : 'Panamanian',
-    62 : 'Paraguayan',
-    63 : 'Peruvian',
-    64 : 'Polish',
-    65 : 'Portuguese',
-    66 : 'Qatari',
-    67 : 'Romanian',
-    68 : 'Russian',
-    69 : 'Salvadoran',
-    70 : 'Saudi',
-    71 : 'Scottish',
-    72 : 'Serbian',
-    73 : 'Singaporean',
-    74 : 'Slovakian',
-    75 : 'Slovenian',
-    76 : 'South Korean',
-    77 : 'South African',
-    78 : 'Spanish',
-    79 : 'Swedish',
-    80 : 'Swiss',
-    81 : 'Thai',
-    82 : 'Turkish',
-    83 : 'Uruguayan',
-    84 : 'Ukrainian',
-    85 : 'Venezuelan',
-    86 : 'Welsh',
-    87 : 'Barbadian',
-    88 : 'Vietnamese'
-}
+})
+
+
+# Dense lookup tables over the full one-byte ID space for the sparse mappings above,
+# so the per-car decode path indexes a tuple instead of hashing into a dict. Unassigned
+# IDs hold the empty string. The names are interned, which lets repeated downstream
+# hashing (dict keys, JSON serialization) compare by pointer.
+_TEAM_LUT = tuple(sys.intern(TeamIDs.get(i, '')) for i in range(256))
+_DRIVER_LUT = tuple(sys.intern(DriverIDs.get(i, '')) for i in range(256))
+
+
+def team_name(team_id):
+    """Return the team name for a teamId byte, or the empty string if unassigned."""
+    return _TEAM_LUT[team_id]
+
+
+def driver_name(driver_id):
+    """Return the driver name for a driverId byte, or the empty string if unassigned."""
+    return _DRIVER_LUT[driver_id]
+
+
+TrackIDs = (
+    'Melbourne',           #  0
+    'Paul Ricard',         #  1
+    'Shanghai',            #  2
+    'Sakhir (Bahrain)',    #  3
+    'Catalunya',           #  4
+    'Monaco',              #  5
+    'Montreal',            #  6
+    'Silverstone',         #  7
+    'Hockenheim',          #  8
+    'Hungaroring',         #  9
+    'Spa',                 # 10
+    'Monza',               # 11
+    'Singapore',           # 12
+    'Suzuka',              # 13
+    'Abu Dhabi',           # 14
+    'Texas',               # 15
+    'Brazil',              # 16
+    'Austria',             # 17
+    'Sochi',               # 18
+    'Mexico',              # 19
+    'Baku (Azerbaijan)',   # 20
+    'Sakhir Short',        # 21
+    'Silverstone Short',   # 22
+    'Texas Short',         # 23
+    'Suzuka Short',        # 24
+    'Hanoi',               # 25
+    'Zandvoort'            # 26
+)
+
+
+NationalityIDs = (
+    None,               #  0 (unused)
+    'American',         #  1
+    'Argentinian',      #  2
+    'Australian',       #  3
+    'Austrian',         #  4
+    'Azerbaijani',      #  5
+    'Bahraini',         #  6
+    'Belgian',          #  7
+    'Bolivian',         #  8
+    'Brazilian',        #  9
+    'British',          # 10
+    'Bulgarian',        # 11
+    'Cameroonian',      # 12
+    'Canadian',         # 13
+    'Chilean',          # 14
+    'Chinese',          # 15
+    'Colombian',        # 16
+    'Costa Rican',      # 17
+    'Croatian',         # 18
+    'Cypriot',          # 19
+    'Czech',            # 20
+    'Danish',           # 21
+    'Dutch',            # 22
+    'Ecuadorian',       # 23
+    'English',          # 24
+    'Emirian',          # 25
+    'Estonian',         # 26
+    'Finnish',          # 27
+    'French',           # 28
+    'German',           # 29
+    'Ghanaian',         # 30
+    'Greek',            # 31
+    'Guatemalan',       # 32
+    'Honduran',         # 33
+    'Hong Konger',      # 34
+    'Hungarian',        # 35
+    'Icelander',        # 36
+    'Indian',           # 37
+    'Indonesian',       # 38
+    'Irish',            # 39
+    'Israeli',          # 40
+    'Italian',          # 41
+    'Jamaican',         # 42
+    'Japanese',         # 43
+    'Jordanian',        # 44
+    'Kuwaiti',          # 45
+    'Latvian',          # 46
+    'Lebanese',         # 47
+    'Lithuanian',       # 48
+    'Luxembourger',     # 49
+    'Malaysian',        # 50
+    'Maltese',          # 51
+    'Mexican',          # 52
+    'Monegasque',       # 53
+    'New Zealander',    # 54
+    'Nicaraguan',       # 55
+    'North Korean',     # 56
+    'Northern Irish',   # 57
+    'Norwegian',        # 58
+    'Omani',            # 59
+    'Pakistani',        # 60
+    'Panamanian',       # 61
+    'Paraguayan',       # 62
+    'Peruvian',         # 63
+    'Polish',           # 64
+    'Portuguese',       # 65
+    'Qatari',           # 66
+    'Romanian',         # 67
+    'Russian',          # 68
+    'Salvadoran',       # 69
+    'Saudi',            # 70
+    'Scottish',         # 71
+    'Serbian',          # 72
+    'Singaporean',      # 73
+    'Slovakian',        # 74
+    'Slovenian',        # 75
+    'South Korean',     # 76
+    'South African',    # 77
+    'Spanish',          # 78
+    'Swedish',          # 79
+    'Swiss',            # 80
+    'Thai',             # 81
+    'Turkish',          # 82
+    'Uruguayan',        # 83
+    'Ukrainian',        # 84
+    'Venezuelan',       # 85
+    'Welsh',            # 86
+    'Barbadian',        # 87
+    'Vietnamese'        # 88
+)
 
 
 # These surface types are from physics data and show what type of contact each wheel is experiencing.
-SurfaceTypes = {
-     0 : 'Tarmac',
-     1 : 'Rumble strip',
-     2 : 'Concrete',
-     3 : 'Rock',
-     4 : 'Gravel',
-     5 : 'Mud',
-     6 : 'Sand',
-     7 : 'Grass',
-     8 : 'Water',
-     9 : 'Cobblestone',
-    10 : 'Metal',
-    11 : 'Ridged'
-}
-
-PenaltyTypes = {
-     0 : 'Drive through',
-     1 : 'Stop Go',
-     2 : 'Grid penalty',
-     3 : 'Penalty reminder',
-     4 : 'Time penalty',
-     5 : 'Warning',
-     6 : 'Disqualified',
-     7 : 'Removed from formation lap',
-     8 : 'Parked too long timer',
-     9 : 'Tyre regulations',
-    10 : 'This lap invalidated',
-    11 : 'This and next lap invalidated',
-    12 : 'This lap invalidated without reason',
-    13 : 'This and next lap invalidated without reason',
-    14 : 'This and previous lap invalidated',
-    15 : 'This and previous lap invalidated without reason',
-    16 : 'Retired',
-    17 : 'Black flag timer'
-}
-
-InfringementTypes = {
-     0 : 'Blocking by slow driving',
-     1 : 'Blocking by wrong way driving',
-     2 : 'Reversing off the start line',
-     3 : 'Big Collision',
-     4 : 'Small Collision',
-     5 : 'Collision failed to hand back position single',
-     6 : 'Collision failed to hand back position multiple',
-     7 : 'Corner cutting gained time',
-     8 : 'Corner cutting overtake single',
-     9 : 'Corner cutting overtake multiple',
-    10 : 'Crossed pit exit lane',
-    11 : 'Ignoring blue flags',
-    12 : 'Ignoring yellow flags',
-    13 : 'Ignoring drive through',
-    14 : 'Too many drive throughs',
-    15 : 'Drive through reminder serve within n laps',
-    16 : 'Drive through reminder serve this lap',
-    17 : 'Pit lane speeding',
-    18 : 'Parked for too long',
-    19 : 'Ignoring tyre regulations',
-    20 : 'Too many penalties',
-    21 : 'Multiple warnings',
-    22 : 'Approaching disqualification',
-    23 : 'Tyre regulations select single',
-    24 : 'Tyre regulations select multiple',
-    25 : 'Lap invalidated corner cutting',
-    26 : 'Lap invalidated running wide',
-    27 : 'Corner cutting ran wide gained time minor',
-    28 : 'Corner cutting ran wide gained time significant',
-    29 : 'Corner cutting ran wide gained time extreme',
-    30 : 'Lap invalidated wall riding',
-    31 : 'Lap invalidated flashback used',
-    32 : 'Lap invalidated reset to track',
-    33 : 'Blocking the pitlane',
-    34 : 'Jump start',
-    35 : 'Safety car to car collision',
-    36 : 'Safety car illegal overtake',
-    37 : 'Safety car exceeding allowed pace',
-    38 : 'Virtual safety car exceeding allowed pace',
-    39 : 'Formation lap below allowed speed',
-    40 : 'Retired mechanical failure',
-    41 : 'Retired terminally damaged',
-    42 : 'Safety car falling too far back',
-    43 : 'Black flag timer',
-    44 : 'Unserved stop go penalty',
-    45 : 'Unserved drive through penalty',
-    46 : 'Engine component change',
-    47 : 'Gearbox change',
-    48 : 'League grid penalty',
-    49 : 'Retry penalty',
-    50 : 'Illegal time gain',
-    51 : 'Mandatory pitstop'
-}
+SurfaceTypes = (
+    'Tarmac',         #  0
+    'Rumble strip',   #  1
+    'Concrete',       #  2
+    'Rock',           #  3
+    'Gravel',         #  4
+    'Mud',            #  5
+    'Sand',           #  6
+    'Grass',          #  7
+    'Water',          #  8
+    'Cobblestone',    #  9
+    'Metal',          # 10
+    'Ridged'          # 11
+)
+
+PenaltyTypes = (
+    'Drive through',                                      #  0
+    'Stop Go',                                            #  1
+    'Grid penalty',                                       #  2
+    'Penalty reminder',                                   #  3
+    'Time penalty',                                       #  4
+    'Warning',                                            #  5
+    'Disqualified',                                       #  6
+    'Removed from formation lap',                         #  7
+    'Parked too long timer',                              #  8
+    'Tyre regulations',                                   #  9
+    'This lap invalidated',                               # 10
+    'This and next lap invalidated',                      # 11
+    'This lap invalidated without reason',                # 12
+    'This and next lap invalidated without reason',       # 13
+    'This and previous lap invalidated',                  # 14
+    'This and previous lap invalidated without reason',   # 15
+    'Retired',                                            # 16
+    'Black flag timer'                                    # 17
+)
+
+InfringementTypes = (
+    'Blocking by slow driving',                          #  0
+    'Blocking by wrong way driving',                     #  1
+    'Reversing off the start line',                      #  2
+    'Big Collision',                                     #  3
+    'Small Collision',                                   #  4
+    'Collision failed to hand back position single',     #  5
+    'Collision failed to hand back position multiple',   #  6
+    'Corner cutting gained time',                        #  7
+    'Corner cutting overtake single',                    #  8
+    'Corner cutting overtake multiple',                  #  9
+    'Crossed pit exit lane',                             # 10
+    'Ignoring blue flags',                               # 11
+    'Ignoring yellow flags',                             # 12
+    'Ignoring drive through',                            # 13
+    'Too many drive throughs',                           # 14
+    'Drive through reminder serve within n laps',        # 15
+    'Drive through reminder serve this lap',             # 16
+    'Pit lane speeding',                                 # 17
+    'Parked for too long',                               # 18
+    'Ignoring tyre regulations',                         # 19
+    'Too many penalties',                                # 20
+    'Multiple warnings',                                 # 21
+    'Approaching disqualification',                      # 22
+    'Tyre regulations select single',                    # 23
+    'Tyre regulations select multiple',                  # 24
+    'Lap invalidated corner cutting',                    # 25
+    'Lap invalidated running wide',                      # 26
+    'Corner cutting ran wide gained time minor',         # 27
+    'Corner cutting ran wide gained time significant',   # 28
+    'Corner cutting ran wide gained time extreme',       # 29
+    'Lap invalidated wall riding',                       # 30
+    'Lap invalidated flashback used',                    # 31
+    'Lap invalidated reset to track',                    # 32
+    'Blocking the pitlane',                              # 33
+    'Jump start',                                        # 34
+    'Safety car to car collision',                       # 35
+    'Safety car illegal overtake',                       # 36
+    'Safety car exceeding allowed pace',                 # 37
+    'Virtual safety car exceeding allowed pace',         # 38
+    'Formation lap below allowed speed',                 # 39
+    'Retired mechanical failure',                        # 40
+    'Retired terminally damaged',                        # 41
+    'Safety car falling too far back',                   # 42
+    'Black flag timer',                                  # 43
+    'Unserved stop go penalty',                          # 44
+    'Unserved drive through penalty',                    # 45
+    'Engine component change',                           # 46
+    'Gearbox change',                                    # 47
+    'League grid penalty',                               # 48
+    'Retry penalty',                                     # 49
+    'Illegal time gain',                                 # 50
+    'Mandatory pitstop'                                  # 51
+)
 
 
 @enum.unique
@@ -1141,23 +1392,43 @@ class ButtonFlag(enum.IntEnum):
     RIGHT_STICK_CLICK = 0x4000
 
 
-ButtonFlag.description = {
-    ButtonFlag.CROSS             : "Cross or A",
-    ButtonFlag.TRIANGLE          : "Triangle or Y",
-    ButtonFlag.CIRCLE            : "Circle or B",
-    ButtonFlag.SQUARE            : "Square or X",
-    ButtonFlag.D_PAD_LEFT        : "D-pad Left",
-    ButtonFlag.D_PAD_RIGHT       : "D-pad Right",
-    ButtonFlag.D_PAD_UP          : "D-pad Up",
-    ButtonFlag.D_PAD_DOWN        : "D-pad Down",
-    ButtonFlag.OPTIONS           : "Options or Menu",
-    ButtonFlag.L1                : "L1 or LB",
-    ButtonFlag.R1                : "R1 or RB",
-    ButtonFlag.L2                : "L2 or LT",
-    ButtonFlag.R2                : "R2 or RT",
-    ButtonFlag.LEFT_STICK_CLICK  : "Left Stick Click",
-    ButtonFlag.RIGHT_STICK_CLICK : "Right Stick Click"
-}
+# Button descriptions indexed by bit position, so fetching one is a plain tuple index
+# with no dict hashing of IntEnum members. BUTTON_FLAG_DESC[bit] describes the flag
+# with value 1 << bit.
+BUTTON_FLAG_DESC = (
+    "Cross or A",          # bit  0, CROSS
+    "Triangle or Y",       # bit  1, TRIANGLE
+    "Circle or B",         # bit  2, CIRCLE
+    "Square or X",         # bit  3, SQUARE
+    "D-pad Left",          # bit  4, D_PAD_LEFT
+    "D-pad Right",         # bit  5, D_PAD_RIGHT
+    "D-pad Up",            # bit  6, D_PAD_UP
+    "D-pad Down",          # bit  7, D_PAD_DOWN
+    "Options or Menu",     # bit  8, OPTIONS
+    "L1 or LB",            # bit  9, L1
+    "R1 or RB",            # bit 10, R1
+    "L2 or LT",            # bit 11, L2
+    "R2 or RT",            # bit 12, R2
+    "Left Stick Click",    # bit 13, LEFT_STICK_CLICK
+    "Right Stick Click"    # bit 14, RIGHT_STICK_CLICK
+)
+
+
+# Bit mask and description pairs in bit order, precomputed so decoding a buttonStatus
+# word is a tight loop over plain ints rather than over IntEnum members.
+_BTN_BITS = tuple((1 << i, BUTTON_FLAG_DESC[i]) for i in range(15))
+
+
+def button_descriptions(button_status):
+    """Decode a buttonStatus bit field into the descriptions of the pressed buttons.
+
+    Args:
+        button_status: the buttonStatus field from a car telemetry packet.
+
+    Returns:
+        A list with the description of each button currently pressed, in bit order.
+    """
+    return [description for (bit, description) in _BTN_BITS if button_status & bit]
 
 ##################################
 #                                #
@@ -1165,6 +1436,275 @@ ButtonFlag.description = {
 #                                #
 ##################################
 
+# Packet class and size lookups keyed by PacketID, computed once at import time so the
+# receive loop can dispatch and size-check packets without calling ctypes.sizeof per packet.
+HEADER_SIZE = ctypes.sizeof(PacketHeader)
+
+PACKET_CLASS = {
+    PacketID.MOTION               : PacketMotionData_V1,
+    PacketID.SESSION              : PacketSessionData_V1,
+    PacketID.LAP_DATA             : PacketLapData_V1,
+    PacketID.EVENT                : PacketEventData_V1,
+    PacketID.PARTICIPANTS         : PacketParticipantsData_V1,
+    PacketID.CAR_SETUPS           : PacketCarSetupData_V1,
+    PacketID.CAR_TELEMETRY        : PacketCarTelemetryData_V1,
+    PacketID.CAR_STATUS           : PacketCarStatusData_V1,
+    PacketID.FINAL_CLASSIFICATION : PacketFinalClassificationData_V1,
+    PacketID.LOBBY_INFO           : PacketLobbyInfoData_V1
+}
+
+PACKET_SIZE = {packet_id: ctypes.sizeof(cls) for (packet_id, cls) in PACKET_CLASS.items()}
+
+
+def _build_all_repr_plans(cls=PackedLittleEndianStructure):
+    """Build the repr plan for every structure class up front.
+
+    This moves the one-off field classification cost to import time so no repr() call
+    on a hot logging path ever pays it.
+    """
+    for subclass in cls.__subclasses__():
+        subclass._build_repr_plan()
+        _build_all_repr_plans(subclass)
+
+_build_all_repr_plans()
+
+
+# Struct format character for each scalar ctypes field type, used to build unpack plans.
+_CTYPE_FORMAT = {
+    ctypes.c_uint8  : 'B',
+    ctypes.c_int8   : 'b',
+    ctypes.c_uint16 : 'H',
+    ctypes.c_int16  : 'h',
+    ctypes.c_uint32 : 'I',
+    ctypes.c_int32  : 'i',
+    ctypes.c_uint64 : 'Q',
+    ctypes.c_int64  : 'q',
+    ctypes.c_float  : 'f',
+    ctypes.c_double : 'd'
+}
+
+# Per-class export plans of (field name, field offset, pre-compiled struct) covering the
+# scalar fields, built on first use so bulk export can unpack values straight from the
+# packet buffer instead of going through the ctypes field descriptors.
+_EXPORT_PLAN = {}
+
+
+def _build_export_plan(cls):
+    plan = []
+    for (fname, ftype) in cls._fields_:
+        format_char = _CTYPE_FORMAT.get(ftype)
+        if format_char is not None:
+            plan.append((fname, getattr(cls, fname).offset, struct.Struct('<' + format_char)))
+    _EXPORT_PLAN[cls] = plan
+    return plan
+
+
+def export_scalar_fields(cls, buf, base=0):
+    """Unpack the scalar fields of one structure directly from a raw packet buffer.
+
+    Args:
+        cls: the PackedLittleEndianStructure subclass describing the layout.
+        buf: raw bytes containing the packet.
+        base: position of the start of the structure within buf.
+
+    Returns:
+        A dict mapping field name to value for every scalar (non-array, non-structure)
+        field of cls, in declaration order.
+    """
+    plan = _EXPORT_PLAN.get(cls)
+    if plan is None:
+        plan = _build_export_plan(cls)
+    return {fname: s.unpack_from(buf, base + offset)[0] for (fname, offset, s) in plan}
+
+
+def _build_flat_format(cls):
+    """Build the struct format string and flattened field names matching a structure layout.
+
+    Arrays are expanded element by element and nested structures are recursed into, so
+    the format describes every primitive in the structure. Character arrays stay single
+    bytes values and unions are kept as raw bytes, since only one variant is populated.
+
+    Returns:
+        A (format, names) pair where format is the struct format string (without byte
+        order prefix) and names the matching flattened field names.
+    """
+    fmt = []
+    names = []
+    for (fname, ftype) in cls._fields_:
+        if issubclass(ftype, PackedLittleEndianStructure):
+            sub_fmt, sub_names = _build_flat_format(ftype)
+            fmt.append(sub_fmt)
+            names.extend(f"{fname}.{sub_name}" for sub_name in sub_names)
+        elif issubclass(ftype, ctypes.Union):
+            fmt.append(f"{ctypes.sizeof(ftype)}s")
+            names.append(fname)
+        elif issubclass(ftype, ctypes.Array):
+            element_type = ftype._type_
+            length = ftype._length_
+            if element_type is ctypes.c_char:
+                fmt.append(f"{length}s")
+                names.append(fname)
+            elif issubclass(element_type, PackedLittleEndianStructure):
+                sub_fmt, sub_names = _build_flat_format(element_type)
+                for i in range(length):
+                    fmt.append(sub_fmt)
+                    names.extend(f"{fname}[{i}].{sub_name}" for sub_name in sub_names)
+            else:
+                fmt.append(f"{length}{_CTYPE_FORMAT[element_type]}")
+                names.extend(f"{fname}[{i}]" for i in range(length))
+        else:
+            fmt.append(_CTYPE_FORMAT[ftype])
+            names.append(fname)
+    return "".join(fmt), names
+
+
+def _build_packet_structs():
+    structs = {}
+    fields = {}
+    for cls in PACKET_CLASS.values():
+        fmt, names = _build_flat_format(cls)
+        structs[cls] = struct.Struct('<' + fmt)
+        fields[cls] = tuple(names)
+    return structs, fields
+
+# Aggregate pre-compiled struct and flattened field names per packet class, so a single
+# C-level call can unpack every primitive in a packet at once.
+_PACKET_STRUCT, _PACKET_FIELDS = _build_packet_structs()
+
+
+def flat_field_names(cls):
+    """Return the flattened field names for a packet class, in unpack_all() value order."""
+    return _PACKET_FIELDS[cls]
+
+
+def unpack_all(cls, buf, offset=0):
+    """Unpack every primitive field of a packet in one call.
+
+    Args:
+        cls: the packet class describing the layout.
+        buf: raw bytes containing the packet.
+        offset: position of the start of the packet within buf.
+
+    Returns:
+        A flat tuple with every primitive value in the packet, matching the names
+        returned by flat_field_names().
+    """
+    return _PACKET_STRUCT[cls].unpack_from(buf, offset)
+
+
+def _build_element_struct(cls):
+    fmt, names = _build_flat_format(cls)
+    return struct.Struct('<' + fmt), tuple(names)
+
+
+def _build_car_array_info():
+    info = {}
+    for cls in PACKET_CLASS.values():
+        for (fname, ftype) in cls._fields_:
+            if (issubclass(ftype, ctypes.Array)
+                    and ftype._length_ == 22
+                    and issubclass(ftype._type_, PackedLittleEndianStructure)):
+                element_struct, element_fields = _build_element_struct(ftype._type_)
+                info[cls] = (getattr(cls, fname).offset, ftype._length_, element_struct, element_fields)
+    return info
+
+# Offset and element layout of the 22-car array in every packet class that carries one,
+# derived once at import from the field declarations.
+_CAR_ARRAY_INFO = _build_car_array_info()
+
+
+def unpack_car_columns(cls, buf, offset=0):
+    """Decode a packet's 22-car array into per-field columns.
+
+    Aggregation usually wants one field across all cars (all speeds, all tyre wear),
+    which the array-of-structures layout makes expensive to collect. This transposes the
+    array in one struct pass, so each flattened field name maps to a column holding that
+    field's value for all 22 cars. It works for any packet class carrying a 22-element
+    car array: motion, lap data, participants, car setups, car telemetry, car status,
+    final classification and lobby info.
+
+    Args:
+        cls: the packet class describing the layout.
+        buf: raw bytes containing a packet of that class (header included).
+        offset: position of the start of the packet within buf.
+
+    Returns:
+        A dict mapping each flattened element field name to a tuple of 22 values, one
+        per car.
+    """
+    array_offset, count, element_struct, element_fields = _CAR_ARRAY_INFO[cls]
+    start = offset + array_offset
+    region = memoryview(buf)[start:start + count * element_struct.size]
+    rows = element_struct.iter_unpack(region)
+    return dict(zip(element_fields, zip(*rows)))
+
+
+def unpack_car_telemetry_columns(buf, offset=0):
+    """Decode the 22-car carTelemetryData array into per-field columns.
+
+    See unpack_car_columns(), of which this is the car telemetry shorthand.
+    """
+    return unpack_car_columns(PacketCarTelemetryData_V1, buf, offset)
+
+
+# Per-(packet class, field name) extraction plans of (field offset within the packet,
+# element stride, car count, pre-compiled struct, scalar flag), built on first use.
+_CAR_FIELD_PLAN = {}
+
+
+def _build_car_field_plan(cls, field_name):
+    for (fname, ftype) in cls._fields_:
+        if (issubclass(ftype, ctypes.Array)
+                and ftype._length_ == 22
+                and issubclass(ftype._type_, PackedLittleEndianStructure)):
+            element_type = ftype._type_
+            count = ftype._length_
+            array_offset = getattr(cls, fname).offset
+            break
+    else:
+        raise KeyError(f"{cls.__name__} has no 22-car array")
+
+    field_type = dict(element_type._fields_)[field_name]
+    field_offset = array_offset + getattr(element_type, field_name).offset
+    if issubclass(field_type, ctypes.Array):
+        field_struct = struct.Struct(f"<{field_type._length_}{_CTYPE_FORMAT[field_type._type_]}")
+        scalar = False
+    else:
+        field_struct = struct.Struct('<' + _CTYPE_FORMAT[field_type])
+        scalar = True
+    plan = (field_offset, ctypes.sizeof(element_type), count, field_struct, scalar)
+    _CAR_FIELD_PLAN[(cls, field_name)] = plan
+    return plan
+
+
+def unpack_car_field(cls, buf, field_name, offset=0):
+    """Extract a single field across all 22 cars straight from a raw packet buffer.
+
+    The per-wheel tyre arrays (tyresWear, tyresDamage, tyresPressure and friends) and
+    scalar fields like speed are laid out at a fixed offset and stride within the car
+    array, so one field can be gathered with 22 strided struct reads without decoding
+    the rest of the packet. Ideal for threshold or averaging checks over one column.
+
+    Args:
+        cls: the packet class describing the layout.
+        buf: raw bytes containing a packet of that class (header included).
+        field_name: name of a field of the per-car element structure.
+        offset: position of the start of the packet within buf.
+
+    Returns:
+        A tuple of 22 values, one per car; for per-wheel array fields each value is
+        itself a tuple with one entry per wheel (RL, RR, FL, FR).
+    """
+    plan = _CAR_FIELD_PLAN.get((cls, field_name))
+    if plan is None:
+        plan = _build_car_field_plan(cls, field_name)
+    field_offset, stride, count, field_struct, scalar = plan
+    start = offset + field_offset
+    if scalar:
+        return tuple(field_struct.unpack_from(buf, start + i * stride)[0] for i in range(count))
+    return tuple(field_struct.unpack_from(buf, start + i * stride) for i in range(count))
+
+
 # Map from (packetFormat, packetVersion, packetId) to a specific packet type.
 HeaderFieldsToPacketType = {
     (2020, 1, 0) : PacketMotionData_V1,
@@ -1179,43 +1719,235 @@ HeaderFieldsToPacketType = {
     (2020, 1, 9) : PacketLobbyInfoData_V1
 }
 
+# Packet type and expected size for the decode path, computed once at import so it avoids
+# calling ctypes.sizeof per packet. The key packs the three header key fields into one
+# int, (packetFormat << 16) | (packetVersion << 8) | packetId, so the per-packet lookup
+# hashes a single int instead of allocating and hashing a 3-tuple.
+# HeaderFieldsToPacketType above remains the readable source of the mapping.
+_PACKET_TABLE = {(key[0] << 16) | (key[1] << 8) | key[2]: (cls, ctypes.sizeof(cls))
+                 for (key, cls) in HeaderFieldsToPacketType.items()}
+
+
 class UnpackError(Exception):
     pass
 
-def unpack_udp_packet(packet: bytes) -> PackedLittleEndianStructure:
+
+# Error message templates shared by the decoders, built once so the cold error branches
+# only pay a %-interpolation when they actually fire.
+_ERR_TOO_SHORT = "Bad telemetry packet: too short (%d bytes)."
+_ERR_NO_MATCH = "Bad telemetry packet: no match for key fields %r."
+_ERR_BAD_SIZE = "Bad telemetry packet: bad size for %s packet; expected %d bytes but received %d bytes."
+
+
+def unpack_udp_packet(packet, allowed_ids=None) -> PackedLittleEndianStructure:
     """Convert raw UDP packet to an appropriately-typed telemetry packet.
 
+    When given a writable buffer (a bytearray filled by socket.recv_into, or a memoryview
+    over one) the returned structure is built zero-copy with from_buffer and aliases the
+    caller's buffer, so the buffer must not be overwritten until the packet has been
+    consumed. Read-only bytes are still accepted and fall back to a copy.
+
     Args:
         packet: the contents of the UDP packet to be unpacked.
+        allowed_ids: optional container of packetId values to decode; packets carrying
+            any other id are dropped after header parsing and None is returned, which
+            skips the cost of materializing structures the caller will not consume.
 
     Returns:
-        The decoded packet structure.
+        The decoded packet structure, or None for a packet filtered out by allowed_ids.
+
+    Raises:
+        UnpackError if a problem is detected.
+    """
+    actual_packet_size = len(packet)
+
+    if actual_packet_size < HEADER_SIZE:
+        raise UnpackError(_ERR_TOO_SHORT % actual_packet_size)
+
+    # unpack the header fields with the pre-compiled struct rather than building a
+    # ctypes PacketHeader instance just to read the three dispatch fields
+    header = _HEADER_STRUCT.unpack_from(packet)
+
+    # drop uninteresting packet types after only the header has been parsed
+    if allowed_ids is not None and header[4] not in allowed_ids:
+        return None
+
+    key = (header[0] << 16) | (header[3] << 8) | header[4]  # packetFormat, packetVersion, packetId
+
+    entry = _PACKET_TABLE.get(key)
+
+    # single fused check on the happy path, the error branches only run on bad packets
+    if entry is None or actual_packet_size != entry[1]:
+        if entry is None:
+            raise UnpackError(_ERR_NO_MATCH % ((header[0], header[3], header[4]),))
+        raise UnpackError(_ERR_BAD_SIZE % (entry[0].__name__, entry[1], actual_packet_size))
+
+    try:
+        return entry[0].from_buffer(packet)
+    except TypeError:
+        # read-only buffer, fall back to copying the payload
+        return entry[0].from_buffer_copy(packet)
+
+
+def unpack_udp_packet_flat(packet):
+    """Decode a raw UDP packet into a flat dict of primitive values in one pass.
+
+    Instead of materializing a ctypes structure and paying a Python-level descriptor
+    call per field read, this unpacks every primitive in the packet with the single
+    pre-compiled struct for its type and zips the values with the flattened field
+    names. Reading out a whole packet this way is one C-level call rather than
+    thousands of attribute accesses.
+
+    Args:
+        packet: the contents of the UDP packet to be unpacked.
+
+    Returns:
+        A dict mapping each flattened field name (see flat_field_names()) to its value.
 
     Raises:
         UnpackError if a problem is detected.
     """
     actual_packet_size = len(packet)
 
-    header_size = ctypes.sizeof(PacketHeader)
+    if actual_packet_size < HEADER_SIZE:
+        raise UnpackError(_ERR_TOO_SHORT % actual_packet_size)
 
-    if actual_packet_size < header_size:
-        raise UnpackError(f"Bad telemetry packet: too short ({actual_packet_size} bytes).")
+    header = _HEADER_STRUCT.unpack_from(packet)
+    key = (header[0] << 16) | (header[3] << 8) | header[4]  # packetFormat, packetVersion, packetId
 
-    header = PacketHeader.from_buffer_copy(packet)
-    key = (header.packetFormat, header.packetVersion, header.packetId)
+    entry = _PACKET_TABLE.get(key)
 
-    if key not in HeaderFieldsToPacketType:
-        raise UnpackError(f"Bad telemetry packet: no match for key fields {key!r}.")
+    if entry is None or actual_packet_size != entry[1]:
+        if entry is None:
+            raise UnpackError(_ERR_NO_MATCH % ((header[0], header[3], header[4]),))
+        raise UnpackError(_ERR_BAD_SIZE % (entry[0].__name__, entry[1], actual_packet_size))
 
-    packet_type = HeaderFieldsToPacketType[key]
+    cls = entry[0]
+    return dict(zip(_PACKET_FIELDS[cls], _PACKET_STRUCT[cls].unpack_from(packet)))
 
-    expected_packet_size = ctypes.sizeof(packet_type)
+
+def unpack_udp_packet_columns(packet):
+    """Decode a raw UDP packet straight into per-field columns over the 22 cars.
+
+    Structure-of-arrays counterpart to unpack_udp_packet(): the header is parsed for
+    dispatch, then the packet's car array is transposed with unpack_car_columns(), so
+    column-oriented work (all world positions, all current lap times) never builds the
+    ctypes structure or touches its per-field descriptors.
+
+    Args:
+        packet: the contents of the UDP packet to be unpacked. The packet type must
+            carry a 22-car array; motion, lap data, participants, car setups, car
+            telemetry, car status, final classification and lobby info all qualify.
+
+    Returns:
+        A dict mapping each flattened car field name to a tuple of 22 values.
+
+    Raises:
+        UnpackError if a problem is detected, or KeyError for a valid packet type that
+        carries no car array (session, event).
+    """
+    actual_packet_size = len(packet)
+
+    if actual_packet_size < HEADER_SIZE:
+        raise UnpackError(_ERR_TOO_SHORT % actual_packet_size)
+
+    header = _HEADER_STRUCT.unpack_from(packet)
+    key = (header[0] << 16) | (header[3] << 8) | header[4]  # packetFormat, packetVersion, packetId
+
+    entry = _PACKET_TABLE.get(key)
+
+    if entry is None or actual_packet_size != entry[1]:
+        if entry is None:
+            raise UnpackError(_ERR_NO_MATCH % ((header[0], header[3], header[4]),))
+        raise UnpackError(_ERR_BAD_SIZE % (entry[0].__name__, entry[1], actual_packet_size))
+
+    return unpack_car_columns(entry[0], packet)
+
+
+# Reusable receive buffer for receive_packet(), large enough for the biggest packet.
+_RECV_BUF = bytearray(2048)
+
+def receive_packet(sock, buf=None):
+    """Receive and decode one telemetry packet from a UDP socket with no per-packet allocation.
+
+    The datagram is read into a reusable buffer with recv_into, and the matching packet
+    structure is constructed zero-copy over that buffer with from_buffer. The returned
+    packet views the buffer directly, so callers must finish reading its fields before
+    the next receive overwrites them.
+
+    Args:
+        sock: the bound UDP socket to read from.
+        buf: optional writable buffer to receive into, defaults to a shared module buffer.
+
+    Returns:
+        The decoded packet structure.
+
+    Raises:
+        UnpackError if a problem is detected.
+    """
+    if buf is None:
+        buf = _RECV_BUF
+
+    actual_packet_size = sock.recv_into(buf)
+
+    if actual_packet_size < HEADER_SIZE:
+        raise UnpackError(_ERR_TOO_SHORT % actual_packet_size)
+
+    try:
+        packet_id = PacketID(peek_packet_id(buf))
+    except ValueError:
+        raise UnpackError(f"Bad telemetry packet: no match for packetId {peek_packet_id(buf)!r}.")
+
+    packet_type = PACKET_CLASS[packet_id]
+
+    expected_packet_size = PACKET_SIZE[packet_id]
 
     if actual_packet_size != expected_packet_size:
-        raise UnpackError("Bad telemetry packet: bad size for {} packet; expected {} bytes but received {} bytes.".format(
-            packet_type.__name__, expected_packet_size, actual_packet_size))
+        raise UnpackError(_ERR_BAD_SIZE % (packet_type.__name__, expected_packet_size, actual_packet_size))
+
+    return packet_type.from_buffer(buf)
+
+
+# Magic tag prefixed to packets framed for binary transport between processes.
+WIRE_MAGIC = b'F12020'
+_WIRE_MAGIC_SIZE = len(WIRE_MAGIC)
+
+
+def to_wire(packet):
+    """Frame a telemetry packet for binary transport without a JSON round-trip.
+
+    The game's packets are already little-endian, fixed layout and self-describing
+    through their header, so a forwarder can ship the original bytes tagged with
+    WIRE_MAGIC and the receiving side can decode them with the same packet classes.
+    That skips JSON encoding entirely and the frame is several times smaller than
+    the JSON rendering of the same packet.
+
+    Args:
+        packet: the raw UDP packet bytes, or a decoded packet structure.
+
+    Returns:
+        The framed bytes: WIRE_MAGIC followed by the unmodified packet bytes.
+    """
+    return WIRE_MAGIC + bytes(packet)
+
+
+def from_wire(frame):
+    """Decode a packet framed by to_wire().
+
+    Args:
+        frame: the framed bytes as produced by to_wire().
+
+    Returns:
+        The decoded packet structure, as returned by unpack_udp_packet().
+
+    Raises:
+        UnpackError if the frame does not carry the WIRE_MAGIC tag or the payload is
+        not a valid telemetry packet.
+    """
+    if frame[:_WIRE_MAGIC_SIZE] != WIRE_MAGIC:
+        raise UnpackError(f"Bad wire frame: does not start with {WIRE_MAGIC!r}.")
+    return unpack_udp_packet(frame[_WIRE_MAGIC_SIZE:])
 
-    return packet_type.from_buffer_copy(packet)
 
 #########################################################################
 #                                                                       #
@@ -1223,17 +1955,30 @@ def unpack_udp_packet(packet: bytes) -> PackedLittleEndianStructure:
 #                                                                       #
 #########################################################################
 
+# Packet sizes as documented in the F1 2020 UDP specification, keyed by PacketID.
+_EXPECTED_PACKET_SIZE = {
+    PacketID.MOTION               : 1464,
+    PacketID.SESSION              :  251,
+    PacketID.LAP_DATA             : 1190,
+    PacketID.EVENT                :   35,
+    PacketID.PARTICIPANTS         : 1213,
+    PacketID.CAR_SETUPS           : 1102,
+    PacketID.CAR_TELEMETRY        : 1307,
+    PacketID.CAR_STATUS           : 1344,
+    PacketID.FINAL_CLASSIFICATION :  839,
+    PacketID.LOBBY_INFO           : 1169
+}
+
+
+def _verify_packet_sizes():
+    """Check every packet class against the sizes documented in the UDP specification."""
+    for (packet_id, expected_size) in _EXPECTED_PACKET_SIZE.items():
+        assert PACKET_SIZE[packet_id] == expected_size, \
+            "{} is {} bytes, specification says {}".format(
+                PACKET_CLASS[packet_id].__name__, PACKET_SIZE[packet_id], expected_size)
+
+
 if __name__ == "__main__":
 
     # Check all the packet sizes.
-
-    assert ctypes.sizeof(PacketMotionData_V1)              == 1464
-    assert ctypes.sizeof(PacketSessionData_V1)             ==  251
-    assert ctypes.sizeof(PacketLapData_V1)                 == 1190
-    assert ctypes.sizeof(PacketEventData_V1)               ==   35
-    assert ctypes.sizeof(PacketParticipantsData_V1)        == 1213
-    assert ctypes.sizeof(PacketCarSetupData_V1)            == 1102
-    assert ctypes.sizeof(PacketCarTelemetryData_V1)        == 1307
-    assert ctypes.sizeof(PacketCarStatusData_V1)           == 1344
-    assert ctypes.sizeof(PacketFinalClassificationData_V1) ==  839
-    assert ctypes.sizeof(PacketLobbyInfoData_V1)           == 1169
+    _verify_packet_sizes()